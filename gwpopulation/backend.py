@@ -25,7 +25,7 @@ def modules_to_update():
     all_with_xp.extend(
         [module.value for module in entry_points(group="gwpopulation.xp")]
     )
-    all_with_scs = [".models.mass", ".utils"]
+    all_with_scs = [".models.mass", ".models.spin", ".utils"]
     all_with_scs.extend(
         [module.value for module in entry_points(group="gwpopulation.scs")]
     )
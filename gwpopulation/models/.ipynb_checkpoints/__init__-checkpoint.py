@@ -1,5 +0,0 @@
-"""
-Implemented population models.
-"""
-
-from . import mass, redshift, spin
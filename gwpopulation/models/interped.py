@@ -1,3 +1,5 @@
+import hashlib
+import weakref
 from functools import partial
 
 import numpy as np
@@ -6,6 +8,8 @@ from ..utils import to_numpy
 
 xp = np
 
+_INTERPOLANT_CACHE_SIZE = 32
+
 
 def _setup_interpolant(nodes, values, kind="cubic", backend=xp):
     """
@@ -41,6 +45,8 @@ class InterpolatedNoBaseModelIdentical:
         Whether to use log-spaced nodes, default=False
     """
 
+    _interpolant_cache = dict()
+
     def __init__(
         self, parameters, minimum, maximum, nodes=10, kind="cubic", log_nodes=False
     ):
@@ -74,23 +80,70 @@ class InterpolatedNoBaseModelIdentical:
         else:
             func = xp.array
         kwargs = dict(kind=self.kind, backend=xp)
-        self._norm_spline = _setup_interpolant(func(nodes), func(self._xs), **kwargs)
+        self._norm_spline = self._cached_interpolant(
+            nodes,
+            ("norm", self.min, self.max, len(self._xs)),
+            lambda: _setup_interpolant(func(nodes), func(self._xs), **kwargs),
+        )
         self._data_spline = {
-            param: _setup_interpolant(func(nodes), func(values[param]), **kwargs)
+            param: self._cached_interpolant(
+                nodes,
+                values[param],
+                lambda: _setup_interpolant(func(nodes), func(values[param]), **kwargs),
+            )
             for param in self.parameters
         }
 
+    def _cached_interpolant(self, nodes, values, build):
+        """
+        Reuse interpolants between instances, e.g., when a sampler rebuilds
+        the model, as they only depend on the nodes and evaluation points.
+
+        Evaluation points are identified by their contents and the cached
+        interpolant is discarded when the array it was built for is garbage
+        collected. Nothing is cached with :code:`jax`.
+        """
+        if "jax" in xp.__name__:
+            return build()
+        if isinstance(values, tuple):
+            values_key = values
+        else:
+            array = np.ascontiguousarray(to_numpy(values))
+            values_key = (
+                array.shape,
+                array.dtype.str,
+                hashlib.sha1(array.view(np.uint8)).hexdigest(),
+            )
+        key = (
+            xp.__name__,
+            self.kind,
+            self.log_nodes,
+            tuple(to_numpy(nodes).tolist()),
+            values_key,
+        )
+        cache = InterpolatedNoBaseModelIdentical._interpolant_cache
+        if key not in cache:
+            interpolant = build()
+            if not isinstance(values, tuple):
+                try:
+                    weakref.finalize(values, cache.pop, key, None)
+                except TypeError:
+                    return interpolant
+            if len(cache) >= _INTERPOLANT_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[key] = interpolant
+        return cache[key]
+
     def p_x_unnormed(self, dataset, parameter, x_splines, f_splines, **kwargs):
 
         if self._norm_spline is None:
             self.setup_interpolant(x_splines, dataset)
 
+        values = dataset[parameter]
         perturbation = self._data_spline[parameter](y=f_splines)
 
         p_x = xp.exp(perturbation)
-        p_x *= (dataset[f"{parameter}"] >= x_splines[0]) & (
-            dataset[f"{parameter}"] <= x_splines[-1]
-        )
+        p_x *= (values >= x_splines[0]) & (values <= x_splines[-1])
         return p_x
 
     def norm_p_x(self, f_splines=None, x_splines=None, **kwargs):
@@ -1,11 +1,89 @@
 """
 Implemented spin models
 """
-import numpy as xp
-
-from ..utils import beta_dist, truncnorm, truncskewnorm, unnormalized_2d_gaussian, unnormalized_2d_skew_gaussian
+from operator import gt
+
+import numpy as np
+import scipy.special as scs
+
+from ..utils import (
+    _host_special,
+    _log_beta_function,
+    apply_conditions,
+    beta_dist,
+    bivariate_normal_cdf,
+    cache_scalar_arguments,
+    truncnorm,
+    truncskewnorm,
+    unnormalized_2d_gaussian,
+    unnormalized_2d_skew_gaussian,
+)
 from .interped import InterpolatedNoBaseModelIdentical
 
+xp = np
+
+_CHI_EFF_GRID_SIZES = (125, 250, 500)
+_CHI_P_GRID_SIZES = (63, 125, 250)
+_POINTS_PER_WIDTH = 24
+_ONE_AS_UINT64 = np.float64(1).view(np.uint64)
+_MIN_ANALYTIC_PROBABILITY = 1e-8
+
+
+def _trapezoid_weights(xx):
+    """Trapezoid rule weights for uniformly spaced abscissae"""
+    weights = np.full(len(xx), xx[1] - xx[0])
+    weights[[0, -1]] /= 2
+    return weights
+
+
+def _normalization_grid_size(width, span, sizes):
+    """
+    The smallest grid size with at least :code:`_POINTS_PER_WIDTH` points
+    across the characteristic width of the integrand.
+
+    The normalization is not continuous where the grid size changes, the
+    coarser grids differ from the full grid by at most ~1e-4 relative for
+    widths, skews, and correlations up to one, five, and 0.9.
+    """
+    for size in sizes:
+        if width * (size - 1) >= _POINTS_PER_WIDTH * span:
+            return size
+    return sizes[-1]
+
+
+_NORMALIZATION_GRIDS = dict()
+
+
+def _normalization_grid(n_chi_eff=500, n_chi_p=250):
+    r"""
+    The :math:`\chi_{\text{eff}}`, :math:`\chi_p` grids and trapezoid weights
+    used for numerical normalization in the current backend.
+
+    The arrays are only transferred to the backend once, e.g., to avoid
+    copying the grid to the GPU on every call with :code:`cupy`. They are
+    not stored for :code:`jax` as they may be created while tracing.
+    """
+    key = (xp.__name__, n_chi_eff, n_chi_p)
+    if key in _NORMALIZATION_GRIDS:
+        return _NORMALIZATION_GRIDS[key]
+    chi_eff = np.linspace(-1, 1, n_chi_eff)
+    chi_p = np.linspace(0, 1, n_chi_p)
+    # the axes broadcast against each other rather than storing full grids
+    chi_eff_grid = chi_eff[None, :]
+    chi_p_grid = chi_p[:, None]
+    grid = tuple(
+        xp.asarray(array)
+        for array in (
+            chi_eff_grid,
+            chi_p_grid,
+            _trapezoid_weights(chi_eff),
+            _trapezoid_weights(chi_p),
+        )
+    )
+    if "jax" not in xp.__name__:
+        _NORMALIZATION_GRIDS[key] = grid
+    return grid
+
 
 def iid_spin(dataset, xi_spin, sigma_spin, amax, alpha_chi, beta_chi):
     r"""
@@ -27,9 +105,18 @@ def iid_spin(dataset, xi_spin, sigma_spin, amax, alpha_chi, beta_chi):
     amax: float
         Maximum black hole spin.
     """
-    prior = iid_spin_orientation_gaussian_isotropic(
-        dataset, xi_spin, sigma_spin
-    ) * iid_spin_magnitude_beta(dataset, amax, alpha_chi, beta_chi)
+    prior = _iid_beta_dist(
+        dataset["a_1"], dataset["a_2"], alpha_chi, beta_chi, scale=amax
+    )
+    if "jax" not in xp.__name__ and xi_spin == 0:
+        prior /= 4
+    else:
+        orientation = _iid_aligned_spin_tilts(
+            dataset["cos_tilt_1"], dataset["cos_tilt_2"], sigma_spin
+        )
+        orientation *= xi_spin
+        orientation += (1 - xi_spin) / 4
+        prior *= orientation
     return prior
 
 
@@ -48,9 +135,28 @@ def iid_spin_magnitude_beta(dataset, amax=1, alpha_chi=1, beta_chi=1):
     amax: float
         Maximum black hole spin.
     """
-    return independent_spin_magnitude_beta(
-        dataset, alpha_chi, alpha_chi, beta_chi, beta_chi, amax, amax
+    return _iid_beta_dist(
+        dataset["a_1"], dataset["a_2"], alpha_chi, beta_chi, scale=amax
+    )
+
+
+@apply_conditions(dict(alpha=(gt, 0), beta=(gt, 0), scale=(gt, 0)))
+def _iid_beta_dist(xx_1, xx_2, alpha, beta, scale):
+    """
+    The product of two identical Beta distributions, see
+    :func:`gwpopulation.utils.beta_dist`.
+
+    The normalization is only computed once and the logarithms of the
+    products are taken to halve the number of transcendental evaluations.
+    """
+    ln_prob = (alpha - 1) * xp.log(xx_1 * xx_2)
+    ln_prob += (beta - 1) * xp.log((scale - xx_1) * (scale - xx_2))
+    ln_prob -= 2 * (
+        _log_beta_function(alpha, beta) + (alpha + beta - 1) * xp.log(scale)
     )
+    prob = xp.nan_to_num(xp.exp(ln_prob))
+    prob *= (xx_1 >= 0) & (xx_1 <= scale) & (xx_2 >= 0) & (xx_2 <= scale)
+    return prob
 
 
 def independent_spin_magnitude_beta(
@@ -132,12 +238,42 @@ def independent_spin_orientation_gaussian_isotropic(dataset, xi_spin, sigma_1, s
         Width of preferentially aligned component for the less
         massive black hole (:math:`\sigma_2`).
     """
-    prior = (1 - xi_spin) / 4 + xi_spin * truncnorm(
-        dataset["cos_tilt_1"], 1, sigma_1, 1, -1
-    ) * truncnorm(dataset["cos_tilt_2"], 1, sigma_2, 1, -1)
+    if "jax" not in xp.__name__ and xi_spin == 0:
+        return xp.ones(xp.shape(dataset["cos_tilt_1"])) / 4
+    aligned = _aligned_spin_tilt(dataset["cos_tilt_1"], sigma_1)
+    aligned *= _aligned_spin_tilt(dataset["cos_tilt_2"], sigma_2)
+    if "jax" not in xp.__name__ and xi_spin == 1:
+        return aligned
+    prior = (1 - xi_spin) / 4 + xi_spin * aligned
     return prior
 
 
+def _aligned_spin_tilt(cos_tilt, sigma):
+    r"""
+    The truncated normal distribution in :code:`cos_tilt` with :math:`\mu=1`,
+    :math:`z_\min=-1`, :math:`z_\max=1`, see :func:`gwpopulation.utils.truncnorm`.
+
+    With fixed bounds the normalization reduces to a single error function.
+    """
+    norm = (2 / xp.pi) ** 0.5 / sigma / scs.erf(2**0.5 / sigma)
+    prob = xp.exp(-((cos_tilt - 1) ** 2) / (2 * sigma**2))
+    prob *= norm
+    prob *= (cos_tilt <= 1) & (cos_tilt >= -1)
+    return prob
+
+
+def _iid_aligned_spin_tilts(cos_tilt_1, cos_tilt_2, sigma):
+    """
+    The product of two identical aligned spin tilt distributions, see
+    :func:`_aligned_spin_tilt`, evaluated with a single exponential.
+    """
+    norm = 2 / xp.pi / sigma**2 / scs.erf(2**0.5 / sigma) ** 2
+    prob = xp.exp(-((cos_tilt_1 - 1) ** 2 + (cos_tilt_2 - 1) ** 2) / (2 * sigma**2))
+    prob *= norm
+    prob *= (xp.abs(cos_tilt_1) <= 1) & (xp.abs(cos_tilt_2) <= 1)
+    return prob
+
+
 def gaussian_chi_eff(dataset, mu_chi_eff, sigma_chi_eff):
     r"""
     A Gaussian in chi effective distribution
@@ -194,6 +330,128 @@ def gaussian_chi_p(dataset, mu_chi_p, sigma_chi_p):
     return truncnorm(dataset["chi_p"], mu=mu_chi_p, sigma=sigma_chi_p, low=0, high=1)
 
 
+def _in_chi_p_chi_eff_domain(chi_eff, chi_p):
+    r"""
+    Boolean mask for samples with :math:`|\chi_{\text{eff}}| \leq 1` and
+    :math:`0 \leq \chi_p \leq 1`.
+
+    For double precision :code:`numpy` arrays, non-negative values are ordered
+    in the same way as their bit patterns, so both bounds on :math:`\chi_p`
+    are checked with a single unsigned comparison. Adding zero maps
+    :code:`-0.0` to :code:`0.0` so the mask matches the comparisons used
+    for other arrays.
+    """
+    in_domain = xp.abs(chi_eff) <= 1
+    if isinstance(chi_p, np.ndarray) and chi_p.dtype == np.float64:
+        in_domain &= (chi_p + 0.0).view(np.uint64) <= _ONE_AS_UINT64
+    else:
+        in_domain &= (chi_p <= 1) & (chi_p >= 0)
+    return in_domain
+
+
+@cache_scalar_arguments(maxsize=1024)
+def _gaussian_chi_p_chi_eff_normalization(
+    mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, rho
+):
+    r"""
+    Analytically integrate the unnormalized covariant Gaussian over
+    :math:`\chi_{\text{eff}} \in [-1, 1]`, :math:`\chi_p \in [0, 1]`.
+
+    :func:`gwpopulation.utils.unnormalized_2d_gaussian` is a bivariate normal
+    with correlation :math:`\rho` and widths :math:`\sigma / \sqrt{1 + \rho}`,
+    so the integral is a rectangle probability of that distribution.
+
+    The rectangle probability is a sum of four CDFs of order unity, so it
+    loses relative precision when the peak is far from the domain. Small
+    probabilities are integrated numerically instead.
+    """
+    if "jax" not in xp.__name__ and rho == -1:
+        return _anticorrelated_gaussian_chi_p_chi_eff_normalization(
+            mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p
+        )
+    width_chi_eff = sigma_chi_eff / (1 + rho) ** 0.5
+    width_chi_p = sigma_chi_p / (1 + rho) ** 0.5
+    chi_eff_low, chi_eff_high = [
+        (bound - mu_chi_eff) / width_chi_eff for bound in (-1, 1)
+    ]
+    chi_p_low, chi_p_high = [(bound - mu_chi_p) / width_chi_p for bound in (0, 1)]
+    probability = (
+        bivariate_normal_cdf(chi_eff_high, chi_p_high, rho)
+        - bivariate_normal_cdf(chi_eff_low, chi_p_high, rho)
+        - bivariate_normal_cdf(chi_eff_high, chi_p_low, rho)
+        + bivariate_normal_cdf(chi_eff_low, chi_p_low, rho)
+    )
+    if "jax" not in xp.__name__ and probability < _MIN_ANALYTIC_PROBABILITY:
+        return _gaussian_chi_p_chi_eff_grid_normalization(
+            mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, rho
+        )
+    return 2 * xp.pi * width_chi_eff * width_chi_p * (1 - rho**2) ** 0.5 * probability
+
+
+def _anticorrelated_gaussian_chi_p_chi_eff_normalization(
+    mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p
+):
+    r"""
+    Analytically integrate the unnormalized covariant Gaussian for
+    :math:`\rho = -1` over :math:`\chi_{\text{eff}} \in [-1, 1]`,
+    :math:`\chi_p \in [0, 1]`.
+
+    The distribution is then a ridge which only depends on
+    :math:`u = (\chi_{\text{eff}} - \mu_{\text{eff}}) / \sigma_{\text{eff}}
+    + (\chi_p - \mu_p) / \sigma_p`,
+
+    .. math::
+        \int d\chi_{\text{eff}} d\chi_p \exp(-u^2 / 4) =
+        2 \sqrt{2\pi} \sigma_{\text{eff}} \sigma_p
+        \sum_{\rm corners} \pm G\left(\frac{u}{\sqrt{2}}\right)
+
+    where :math:`G(z) = z \Phi(z) + \phi(z)` is the second antiderivative
+    of the normal density.
+    """
+    # the limits are scalars so this is evaluated on the host
+    total = 0
+    for sign_chi_eff, chi_eff in [(1, 1), (-1, -1)]:
+        for sign_chi_p, chi_p in [(1, 1), (-1, 0)]:
+            zz = (
+                (chi_eff - mu_chi_eff) / sigma_chi_eff
+                + (chi_p - mu_chi_p) / sigma_chi_p
+            ) / 2**0.5
+            total += (
+                sign_chi_eff
+                * sign_chi_p
+                * (
+                    zz * _host_special.ndtr(zz)
+                    + np.exp(-(zz**2) / 2) / (2 * np.pi) ** 0.5
+                )
+            )
+    if total < _MIN_ANALYTIC_PROBABILITY:
+        return _gaussian_chi_p_chi_eff_grid_normalization(
+            mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, -1
+        )
+    return 2 * (2 * np.pi) ** 0.5 * sigma_chi_eff * sigma_chi_p * total
+
+
+def _gaussian_chi_p_chi_eff_grid_normalization(
+    mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, rho
+):
+    r"""
+    Numerically integrate the unnormalized covariant Gaussian over
+    :math:`\chi_{\text{eff}} \in [-1, 1]`, :math:`\chi_p \in [0, 1]` on the
+    full normalization grid.
+    """
+    chi_eff_grid, chi_p_grid, chi_eff_weights, chi_p_weights = _normalization_grid()
+    prob_grid = unnormalized_2d_gaussian(
+        chi_eff_grid,
+        chi_p_grid,
+        mu_chi_eff,
+        mu_chi_p,
+        sigma_chi_eff,
+        sigma_chi_p,
+        rho,
+    )
+    return chi_p_weights @ prob_grid @ chi_eff_weights
+
+
 def gaussian_chi_p_chi_eff(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, rho):
     r"""
     A covariant Gaussian in effective aligned and precessing spins.
@@ -227,24 +485,7 @@ def gaussian_chi_p_chi_eff(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_c
     array-like: The probability
     """
 
-    def _normalization(mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, rho):
-        chi_eff_linspace = xp.linspace(-1, 1, 500)
-        chi_p_linspace = xp.linspace(0, 1, 250)
-        chi_eff_grid, chi_p_grid = xp.meshgrid(chi_eff_linspace, chi_p_linspace)
-
-        prob_grid = unnormalized_2d_gaussian(
-            chi_eff_grid,
-            chi_p_grid,
-            mu_chi_eff,
-            mu_chi_p,
-            sigma_chi_eff,
-            sigma_chi_p,
-            rho,
-        )
-        normalization = xp.trapz(y=xp.trapz(y=prob_grid, axis=-1, x=chi_eff_linspace), axis=-1, x=chi_p_linspace)
-        return normalization
-    
-    if rho == 0:
+    if "jax" not in xp.__name__ and rho == 0:
         prob = gaussian_chi_eff(
             dataset=dataset,
             mu_chi_eff=mu_chi_eff,
@@ -254,16 +495,18 @@ def gaussian_chi_p_chi_eff(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_c
             dataset=dataset, mu_chi_p=mu_chi_p, sigma_chi_p=sigma_chi_p
         )
     else:
+        chi_eff = dataset["chi_eff"]
+        chi_p = dataset["chi_p"]
         prob = unnormalized_2d_gaussian(
-            dataset["chi_eff"],
-            dataset["chi_p"],
+            chi_eff,
+            chi_p,
             mu_chi_eff,
             mu_chi_p,
             sigma_chi_eff,
             sigma_chi_p,
             rho,
         )
-        normalization = _normalization(
+        normalization = _gaussian_chi_p_chi_eff_normalization(
             mu_chi_eff=mu_chi_eff,
             sigma_chi_eff=sigma_chi_eff,
             mu_chi_p=mu_chi_p,
@@ -271,8 +514,7 @@ def gaussian_chi_p_chi_eff(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_c
             rho=rho,
         )
         prob /= normalization
-        prob *= xp.abs(dataset["chi_eff"]) <= 1
-        prob *= (dataset["chi_p"] <= 1) * (dataset["chi_p"] >= 0)
+        prob *= _in_chi_p_chi_eff_domain(chi_eff, chi_p)
         
     return prob
 
@@ -332,6 +574,50 @@ def skew_gaussian_chi_p(dataset, mu_chi_p, sigma_chi_p, skew_chi_p):
     """
     return truncskewnorm(dataset["chi_p"], mu=mu_chi_p, sigma=sigma_chi_p, alpha=skew_chi_p, low=0, high=1)
 
+
+@cache_scalar_arguments(maxsize=1024)
+def _skew_gaussian_chi_p_chi_eff_normalization(
+    mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, skew_chi_eff, skew_chi_p, rho
+):
+    r"""
+    Numerically integrate the unnormalized covariant skew Gaussian over
+    :math:`\chi_{\text{eff}} \in [-1, 1]`, :math:`\chi_p \in [0, 1]`.
+    """
+    if "jax" in xp.__name__:
+        shape = dict()
+    else:
+        # the narrowest feature is set by the width, skewness, and the
+        # correlation, broad distributions are integrated on coarser grids
+        correlation_factor = (1 - abs(rho)) ** 0.5
+        width_chi_eff = sigma_chi_eff / (1 + skew_chi_eff**2) ** 0.5
+        width_chi_p = sigma_chi_p / (1 + skew_chi_p**2) ** 0.5
+        shape = dict(
+            n_chi_eff=_normalization_grid_size(
+                width_chi_eff * correlation_factor, 2, _CHI_EFF_GRID_SIZES
+            ),
+            n_chi_p=_normalization_grid_size(
+                width_chi_p * correlation_factor, 1, _CHI_P_GRID_SIZES
+            ),
+        )
+    chi_eff_grid, chi_p_grid, chi_eff_weights, chi_p_weights = _normalization_grid(
+        **shape
+    )
+    # the integrand is evaluated in double precision, the density can be far
+    # below the single precision range when the peak is outside the domain
+    prob_grid = unnormalized_2d_skew_gaussian(
+        chi_eff_grid,
+        chi_p_grid,
+        mu_chi_eff,
+        mu_chi_p,
+        sigma_chi_eff,
+        sigma_chi_p,
+        skew_chi_eff,
+        skew_chi_p,
+        rho,
+    )
+    return chi_p_weights @ prob_grid @ chi_eff_weights
+
+
 def gaussian_chi_p_chi_eff_skew(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, skew_chi_eff, skew_chi_p, rho):
     r"""
     A covariant Gaussian in effective aligned and precessing spins, including skew.
@@ -369,26 +655,7 @@ def gaussian_chi_p_chi_eff_skew(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, si
     array-like: The probability
     """
 
-    def _normalization(mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, skew_chi_eff, skew_chi_p, rho):
-        chi_eff_linspace = xp.linspace(-1, 1, 500)
-        chi_p_linspace = xp.linspace(0, 1, 250)
-        chi_eff_grid, chi_p_grid = xp.meshgrid(chi_eff_linspace, chi_p_linspace)
-
-        prob_grid = unnormalized_2d_skew_gaussian(
-            chi_eff_grid,
-            chi_p_grid,
-            mu_chi_eff,
-            mu_chi_p,
-            sigma_chi_eff,
-            sigma_chi_p,
-            skew_chi_eff,
-            skew_chi_p,
-            rho,
-        )
-        normalization = xp.trapz(y=xp.trapz(y=prob_grid, axis=-1, x=chi_eff_linspace), axis=-1, x=chi_p_linspace)
-        return normalization
-    
-    if rho == 0:
+    if "jax" not in xp.__name__ and rho == 0:
         prob = skew_gaussian_chi_eff(
             dataset=dataset,
             mu_chi_eff=mu_chi_eff,
@@ -400,9 +667,11 @@ def gaussian_chi_p_chi_eff_skew(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, si
             skew_chi_p=skew_chi_p,
         )
     else:
+        chi_eff = dataset["chi_eff"]
+        chi_p = dataset["chi_p"]
         prob = unnormalized_2d_skew_gaussian(
-            dataset["chi_eff"],
-            dataset["chi_p"],
+            chi_eff,
+            chi_p,
             mu_chi_eff,
             mu_chi_p,
             sigma_chi_eff,
@@ -411,7 +680,7 @@ def gaussian_chi_p_chi_eff_skew(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, si
             skew_chi_p,
             rho,
         )
-        normalization = _normalization(
+        normalization = _skew_gaussian_chi_p_chi_eff_normalization(
             mu_chi_eff=mu_chi_eff,
             sigma_chi_eff=sigma_chi_eff,
             mu_chi_p=mu_chi_p,
@@ -421,8 +690,7 @@ def gaussian_chi_p_chi_eff_skew(dataset, mu_chi_eff, sigma_chi_eff, mu_chi_p, si
             rho=rho,
         )
         prob /= normalization
-        prob *= xp.abs(dataset["chi_eff"]) <= 1
-        prob *= (dataset["chi_p"] <= 1) * (dataset["chi_p"] >= 0)
+        prob *= _in_chi_p_chi_eff_domain(chi_eff, chi_p)
         
     return prob
 
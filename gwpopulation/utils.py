@@ -5,6 +5,10 @@ from numbers import Number
 from operator import eq, ge, gt, le, lt, ne
 
 import numpy as np
+
+# scs is replaced by set_backend, _host_special always refers to scipy for
+# functions missing from some backends, e.g., owens_t is not in cupyx
+import scipy.special as _host_special
 from scipy import special as scs
 
 xp = np
@@ -59,6 +63,55 @@ def apply_conditions(conditions):
     return decorator
 
 
+def cache_scalar_arguments(maxsize=1024):
+    """
+    A decorator to memoize functions of scalar hyper-parameters.
+
+    The cache is keyed on the current backend along with the arguments so
+    that results computed with one array library are not returned after
+    switching to another. Results are not cached when using :code:`jax` as
+    the arguments may be traced, or if any of the arguments are unhashable,
+    e.g., arrays of hyper-parameters.
+
+    Parameters
+    ==========
+    maxsize: int
+        The maximum number of results to store, default=1024.
+    """
+    from functools import lru_cache, wraps
+
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached_function(backend, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @wraps(func)
+        def wrapped_function(*args, **kwargs):
+            if "jax" in xp.__name__:
+                return func(*args, **kwargs)
+            try:
+                return cached_function(xp.__name__, *args, **kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+
+        wrapped_function.cache_clear = cached_function.cache_clear
+        wrapped_function.cache_info = cached_function.cache_info
+        return wrapped_function
+
+    return decorator
+
+
+@cache_scalar_arguments(maxsize=4096)
+def _log_beta_function(alpha, beta):
+    r"""
+    The logarithm of the Beta function :math:`\ln B(\alpha, \beta)`.
+
+    This is memoized as the same hyper-parameters are often evaluated
+    repeatedly, e.g., by multiple models or when reweighting samples.
+    """
+    return scs.betaln(alpha, beta)
+
+
 @apply_conditions(dict(alpha=(gt, 0), beta=(gt, 0), scale=(gt, 0)))
 def beta_dist(xx, alpha, beta, scale=1):
     r"""
@@ -85,7 +138,7 @@ def beta_dist(xx, alpha, beta, scale=1):
 
     """
     ln_beta = (alpha - 1) * xp.log(xx) + (beta - 1) * xp.log(scale - xx)
-    ln_beta -= scs.betaln(alpha, beta)
+    ln_beta -= _log_beta_function(alpha, beta)
     ln_beta -= (alpha + beta - 1) * xp.log(scale)
     prob = xp.exp(ln_beta)
     prob = xp.nan_to_num(prob)
@@ -136,10 +189,12 @@ def truncnorm(xx, mu, sigma, high, low):
 
     .. math::
         p(x) =
-        \sqrt{\frac{2}{\pi\sigma^2}}
-        \left[\text{erf}\left(\frac{x_\max - \mu}{\sqrt{2}\sigma}\right) + \text{erf}\left(\frac{\mu - x_\min}{\sqrt{2}\sigma}\right)\right]^{-1}
+        \frac{1}{\sqrt{2\pi\sigma^2}}
+        \left[\Phi\left(\frac{x_\max - \mu}{\sigma}\right) - \Phi\left(\frac{x_\min - \mu}{\sigma}\right)\right]^{-1}
         \exp\left(-\frac{(\mu - x)^2}{2 \sigma^2}\right)
 
+    where :math:`\Phi` is the standard normal cumulative distribution.
+
     Parameters
     ----------
     xx: float, array-like
@@ -159,11 +214,9 @@ def truncnorm(xx, mu, sigma, high, low):
         The distribution evaluated at `xx`
 
     """
-    norm = 2**0.5 / xp.pi**0.5 / sigma
-    norm /= scs.erf((high - mu) / 2**0.5 / sigma) + scs.erf(
-        (mu - low) / 2**0.5 / sigma
-    )
-    prob = xp.exp(-xp.power(xx - mu, 2) / (2 * sigma**2))
+    norm = 1 / (2 * xp.pi) ** 0.5 / sigma
+    norm /= scs.ndtr((high - mu) / sigma) - scs.ndtr((low - mu) / sigma)
+    prob = xp.exp(-((xx - mu) ** 2) / (2 * sigma**2))
     prob *= norm
     prob *= (xx <= high) & (xx >= low)
     return prob
@@ -207,7 +260,7 @@ def truncskewnorm(xx, mu, sigma, alpha, high, low):
     norm /= scs.erf((high - mu) / 2**0.5 / sigma) + scs.erf(
         (mu - low) / 2**0.5 / sigma) + 4 * scs.owens_t((mu - low) / sigma, alpha)  - 4 * scs.owens_t(
         (high - mu) / sigma, alpha)
-    prob = xp.exp(-xp.power(xx - mu, 2) / (2 * sigma**2)) * (1 + scs.erf(alpha * (xx - mu) / 2**0.5 / sigma))
+    prob = xp.exp(-((xx - mu) ** 2) / (2 * sigma**2)) * (1 + scs.erf(alpha * (xx - mu) / 2**0.5 / sigma))
     prob *= norm
     prob *= (xx <= high) & (xx >= low)
     return prob
@@ -247,16 +300,78 @@ def unnormalized_2d_gaussian(xx, yy, mu_x, mu_y, sigma_x, sigma_y, covariance):
     prob: array-like
         The unnormalized probability distribution (:math:`p(x)`)
     """
-    determinant = sigma_x**2 * sigma_y**2 * (1 - covariance)
-    residual_x = (mu_x - xx) * sigma_y
-    residual_y = (mu_y - yy) * sigma_x
     prob = xp.exp(
-        -(residual_x**2 + residual_y**2 - 2 * residual_x * residual_y * covariance)
-        / 2
-        / determinant
+        _2d_gaussian_exponent(xx - mu_x, yy - mu_y, sigma_x, sigma_y, covariance)
     )
     return prob
 
+
+def _2d_gaussian_exponent(residual_x, residual_y, sigma_x, sigma_y, covariance):
+    """
+    The exponent of :func:`unnormalized_2d_gaussian` given the residuals
+    from the mean.
+
+    The scalar factors of the quadratic form are folded into three
+    coefficients so the exponent only needs a handful of passes over the
+    input arrays.
+    """
+    coeff_xx = 1 / (2 * sigma_x**2 * (1 - covariance))
+    coeff_yy = 1 / (2 * sigma_y**2 * (1 - covariance))
+    coeff_xy = covariance / (sigma_x * sigma_y * (1 - covariance))
+    return (
+        residual_x * (coeff_xy * residual_y - coeff_xx * residual_x)
+        - coeff_yy * residual_y**2
+    )
+
+
+def bivariate_normal_cdf(xx, yy, rho):
+    r"""
+    Cumulative distribution function of a standard bivariate normal
+    distribution with correlation :math:`\rho` using Owen's T function.
+
+    .. math::
+        \Phi_2(x, y; \rho) = \frac{1}{2}\Phi(x) + \frac{1}{2}\Phi(y)
+        - T\left(x, \frac{y - \rho x}{x\sqrt{1 - \rho^2}}\right)
+        - T\left(y, \frac{x - \rho y}{y\sqrt{1 - \rho^2}}\right)
+        - \beta
+
+    where :math:`\beta = 1/2` if :math:`xy < 0` and zero otherwise.
+
+    Parameters
+    ----------
+    xx: float, array-like
+        Upper limit in the first dimension (:math:`x`)
+    yy: float, array-like
+        Upper limit in the second dimension (:math:`y`)
+    rho: float
+        The correlation between the two dimensions (:math:`\rho`)
+
+    Returns
+    -------
+    cdf: float, array-like
+        The probability that both variables are below the limits
+    """
+    if "jax" in xp.__name__:
+        _xp, _scs = xp, scs
+    else:
+        # the limits are typically scalars so the CDF is evaluated on the host
+        _xp, _scs = np, _host_special
+        xx, yy, rho = to_numpy(xx), to_numpy(yy), to_numpy(rho)
+    # the zero limits are found by continuity, replacing zero with a tiny
+    # value gives the correct limit and avoids dividing by zero
+    xx = _xp.where(xx == 0, 1e-100, xx)
+    yy = _xp.where(yy == 0, 1e-100, yy)
+    scale = (1 - rho**2) ** 0.5
+    cdf = (
+        _scs.ndtr(xx) / 2
+        + _scs.ndtr(yy) / 2
+        - _scs.owens_t(xx, (yy - rho * xx) / xx / scale)
+        - _scs.owens_t(yy, (xx - rho * yy) / yy / scale)
+        - (xx * yy < 0) / 2
+    )
+    return cdf
+
+
 def unnormalized_2d_skew_gaussian(xx, yy, mu_x, mu_y, sigma_x, sigma_y, skew_x, skew_y, covariance):
     r"""
     Compute the probability distribution for a correlated 2-dimensional skew Gaussian
@@ -297,9 +412,17 @@ def unnormalized_2d_skew_gaussian(xx, yy, mu_x, mu_y, sigma_x, sigma_y, skew_x,
     prob: array-like
         The unnormalized probability distribution (:math:`p(x)`)
     """
-    norm = 0.5 * (1 + scs.erf(skew_x * (xx - mu_x) / sigma_x / xp.sqrt(2) + skew_y * (yy - mu_y) / sigma_y / xp.sqrt(2)))
-    prob = 2 * unnormalized_2d_gaussian(xx, yy, mu_x, mu_y, sigma_x, sigma_y, covariance)
-    prob *= norm
+    # the residuals are shared between the Gaussian and the skew terms and
+    # the factor of two cancels the one half in the normal CDF
+    residual_x = xx - mu_x
+    residual_y = yy - mu_y
+    prob = 1 + scs.erf(
+        skew_x / sigma_x / 2**0.5 * residual_x
+        + skew_y / sigma_y / 2**0.5 * residual_y
+    )
+    prob *= xp.exp(
+        _2d_gaussian_exponent(residual_x, residual_y, sigma_x, sigma_y, covariance)
+    )
     return prob
 
 
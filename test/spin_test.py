@@ -232,3 +232,266 @@ def test_2d_gaussian_no_covariance_matches_independent(backend):
         )
         < 1e-3
     )
+
+
+@pytest.mark.parametrize("backend", TEST_BACKENDS)
+@pytest.mark.parametrize("rho", [-1, -0.7, 0.5, 0.9])
+def test_gaussian_chi_p_chi_eff_normalized(backend, rho):
+    gwpopulation.set_backend(backend)
+    xp = gwpopulation.utils.xp
+    chi_eff_array = xp.linspace(-1, 1, 1001)
+    chi_p_array = xp.linspace(0, 1, 501)
+    chi_eff, chi_p = xp.meshgrid(chi_eff_array, chi_p_array)
+    parameters = dict(
+        mu_chi_eff=0.1,
+        mu_chi_p=0.3,
+        sigma_chi_eff=0.6,
+        sigma_chi_p=0.5,
+        rho=rho,
+    )
+    prob = spin.gaussian_chi_p_chi_eff(dict(chi_eff=chi_eff, chi_p=chi_p), **parameters)
+    norm = xp.trapz(xp.trapz(prob, chi_eff_array), chi_p_array)
+    assert abs(float(norm) - 1) < 1e-3
+
+
+@pytest.mark.parametrize("backend", TEST_BACKENDS)
+def test_skew_gaussian_chi_p_chi_eff_normalized(backend):
+    gwpopulation.set_backend(backend)
+    xp = gwpopulation.utils.xp
+    chi_eff_array = xp.linspace(-1, 1, 1001)
+    chi_p_array = xp.linspace(0, 1, 501)
+    chi_eff, chi_p = xp.meshgrid(chi_eff_array, chi_p_array)
+    parameters = dict(
+        mu_chi_eff=0.1,
+        mu_chi_p=0.3,
+        sigma_chi_eff=0.6,
+        sigma_chi_p=0.5,
+        skew_chi_eff=2,
+        skew_chi_p=-1,
+        rho=0.5,
+    )
+    prob = spin.gaussian_chi_p_chi_eff_skew(
+        dict(chi_eff=chi_eff, chi_p=chi_p), **parameters
+    )
+    norm = xp.trapz(xp.trapz(prob, chi_eff_array), chi_p_array)
+    assert abs(float(norm) - 1) < 1e-3
+
+
+@pytest.mark.parametrize("backend", TEST_BACKENDS)
+def test_gaussian_chi_p_chi_eff_zero_outside_domain(backend):
+    gwpopulation.set_backend(backend)
+    xp = gwpopulation.utils.xp
+    dataset = dict(
+        chi_eff=xp.asarray([-1.5, 0.2, 0.2, 1.5, 0.2]),
+        chi_p=xp.asarray([0.5, -0.1, 1.1, 0.5, 0.5]),
+    )
+    prob = spin.gaussian_chi_p_chi_eff(
+        dataset,
+        mu_chi_eff=0.1,
+        sigma_chi_eff=0.2,
+        mu_chi_p=0.3,
+        sigma_chi_p=0.2,
+        rho=0.3,
+    )
+    assert float(xp.max(prob[:-1])) == 0
+    assert float(prob[-1]) > 0
+
+
+@pytest.mark.parametrize("backend", TEST_BACKENDS)
+@pytest.mark.parametrize("xi_spin", [0, 1])
+def test_spin_orientation_limits_match_general_expression(backend, xi_spin):
+    gwpopulation.set_backend(backend)
+    xp = gwpopulation.utils.xp
+    _, dataset = tilt_test_data(xp)
+    expected = (1 - xi_spin) / 4 + xi_spin * truncnorm(
+        dataset["cos_tilt_1"], 1, 0.5, 1, -1
+    ) * truncnorm(dataset["cos_tilt_2"], 1, 0.5, 1, -1)
+    prob = spin.iid_spin_orientation_gaussian_isotropic(
+        dataset, xi_spin=xi_spin, sigma_spin=0.5
+    )
+    assert prob.shape == expected.shape
+    assert float(xp.max(xp.abs(prob - expected))) < 1e-10
+
+
+def test_skew_gaussian_adaptive_normalization_matches_full_grid():
+    gwpopulation.set_backend("numpy")
+    from gwpopulation.utils import unnormalized_2d_skew_gaussian
+
+    rng = np.random.default_rng(10)
+    chi_eff, chi_p, chi_eff_weights, chi_p_weights = spin._normalization_grid()
+    for _ in range(5 * N_TEST):
+        parameters = dict(
+            mu_chi_eff=rng.uniform(-1, 1),
+            mu_chi_p=rng.uniform(0, 1),
+            sigma_chi_eff=rng.uniform(0.02, 1),
+            sigma_chi_p=rng.uniform(0.02, 1),
+            skew_chi_eff=rng.uniform(-5, 5),
+            skew_chi_p=rng.uniform(-5, 5),
+            rho=rng.uniform(-0.9, 0.9),
+        )
+        full = np.einsum(
+            "i,j,ij->",
+            chi_p_weights,
+            chi_eff_weights,
+            unnormalized_2d_skew_gaussian(chi_eff, chi_p, *parameters.values()),
+        )
+        adaptive = spin._skew_gaussian_chi_p_chi_eff_normalization(**parameters)
+        assert abs(adaptive / full - 1) < 2e-4
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        (0, 0.1, -0.5, 0.05, 0.3),
+        (0, 0.2, -0.35, 0.05, 0.5),
+        (-3, 0.2, 0.5, 0.1, 0.3),
+        (0, 0.3, -1, 0.05, -1),
+    ],
+)
+def test_gaussian_normalization_far_from_domain(parameters):
+    gwpopulation.set_backend("numpy")
+    from gwpopulation.utils import unnormalized_2d_gaussian
+
+    mu_chi_eff, sigma_chi_eff, mu_chi_p, sigma_chi_p, rho = parameters
+    chi_eff = np.linspace(-1, 1, 500)
+    chi_p = np.linspace(0, 1, 250)
+    full = np.trapz(
+        np.trapz(
+            unnormalized_2d_gaussian(
+                chi_eff,
+                chi_p[:, None],
+                mu_chi_eff,
+                mu_chi_p,
+                sigma_chi_eff,
+                sigma_chi_p,
+                rho,
+            ),
+            chi_eff,
+        ),
+        chi_p,
+    )
+    normalization = spin._gaussian_chi_p_chi_eff_normalization(
+        mu_chi_eff=mu_chi_eff,
+        sigma_chi_eff=sigma_chi_eff,
+        mu_chi_p=mu_chi_p,
+        sigma_chi_p=sigma_chi_p,
+        rho=rho,
+    )
+    assert full > 0
+    assert abs(normalization / full - 1) < 1e-3
+    prob = spin.gaussian_chi_p_chi_eff(
+        dict(chi_eff=np.array([0.0, 0.5]), chi_p=np.array([0.0, 0.2])),
+        mu_chi_eff=mu_chi_eff,
+        sigma_chi_eff=sigma_chi_eff,
+        mu_chi_p=mu_chi_p,
+        sigma_chi_p=sigma_chi_p,
+        rho=rho,
+    )
+    assert np.all(np.isfinite(prob))
+
+
+@pytest.mark.parametrize("mu_chi_p", [-1, -2])
+def test_skew_gaussian_normalization_far_from_domain(mu_chi_p):
+    gwpopulation.set_backend("numpy")
+    from gwpopulation.utils import unnormalized_2d_skew_gaussian
+
+    parameters = (0, mu_chi_p, 0.1, 0.08, 0, 0, 0.3)
+    chi_eff = np.linspace(-1, 1, 500)
+    chi_p = np.linspace(0, 1, 250)
+    full = np.trapz(
+        np.trapz(
+            unnormalized_2d_skew_gaussian(chi_eff, chi_p[:, None], *parameters),
+            chi_eff,
+        ),
+        chi_p,
+    )
+    normalization = spin._skew_gaussian_chi_p_chi_eff_normalization(
+        mu_chi_eff=parameters[0],
+        mu_chi_p=parameters[1],
+        sigma_chi_eff=parameters[2],
+        sigma_chi_p=parameters[3],
+        skew_chi_eff=parameters[4],
+        skew_chi_p=parameters[5],
+        rho=parameters[6],
+    )
+    assert full > 0
+    assert abs(normalization / full - 1) < 1e-3
+
+
+@pytest.mark.parametrize("backend", TEST_BACKENDS)
+def test_iid_spin_no_aligned_fraction_matches_components(backend):
+    gwpopulation.set_backend(backend)
+    xp = gwpopulation.utils.xp
+    test_data = dict()
+    test_data.update(tilt_test_data(xp)[1])
+    test_data.update(magnitude_test_data(xp)[1])
+    params = dict(xi_spin=0, sigma_spin=0.5, amax=1, alpha_chi=2, beta_chi=3)
+    assert (
+        float(
+            xp.max(
+                xp.abs(
+                    spin.iid_spin(test_data, **params)
+                    - spin.iid_spin_magnitude_beta(
+                        test_data, amax=1, alpha_chi=2, beta_chi=3
+                    )
+                    / 4
+                )
+            )
+        )
+        < 1e-10
+    )
+
+
+@pytest.mark.parametrize("backend", TEST_BACKENDS)
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_chi_p_chi_eff_domain_matches_comparisons(backend, dtype):
+    gwpopulation.set_backend(backend)
+    xp = gwpopulation.utils.xp
+    chi_p = xp.asarray(
+        [-np.inf, -1, -1e-30, -0.0, 0, 1e-30, 0.5, 1, 1 + 1e-7, 2, np.inf, np.nan],
+        dtype=dtype,
+    )
+    chi_eff = xp.zeros_like(chi_p)
+    mask = spin._in_chi_p_chi_eff_domain(chi_eff, chi_p)
+    assert bool(mask[3])
+    assert bool(xp.all(mask == ((chi_p >= 0) & (chi_p <= 1))))
+
+
+def test_spline_spin_magnitude_reuses_interpolants():
+    gwpopulation.set_backend("numpy")
+    _, dataset = magnitude_test_data(np)
+    parameters = {f"a{ii}": ii / 4 for ii in range(5)}
+    parameters.update({f"fa{ii}": np.sin(ii) for ii in range(5)})
+    first = spin.SplineSpinMagnitudeIdentical()
+    second = spin.SplineSpinMagnitudeIdentical()
+    assert np.array_equal(first(dataset, **parameters), second(dataset, **parameters))
+    assert first._data_spline["a_1"] is second._data_spline["a_1"]
+    assert first._norm_spline is second._norm_spline
+
+
+def test_spline_spin_magnitude_interpolants_follow_dataset():
+    import gc
+
+    gwpopulation.set_backend("numpy")
+    cache = spin.InterpolatedNoBaseModelIdentical._interpolant_cache
+    existing = set(cache)
+    _, dataset = magnitude_test_data(np)
+    parameters = {f"a{ii}": ii / 4 for ii in range(5)}
+    parameters.update({f"fa{ii}": np.sin(ii) for ii in range(5)})
+    first = spin.SplineSpinMagnitudeIdentical()
+    first(dataset, **parameters)
+    dataset["a_1"] *= 0.5
+    second = spin.SplineSpinMagnitudeIdentical()
+    second(dataset, **parameters)
+    assert first._data_spline["a_1"] is not second._data_spline["a_1"]
+    assert first._data_spline["a_2"] is second._data_spline["a_2"]
+    del dataset, first, second
+    gc.collect()
+    assert all(key[-1][0] == "norm" for key in set(cache) - existing)
+
+
+def test_iid_spin_magnitude_beta_invalid_amax_raises():
+    gwpopulation.set_backend("numpy")
+    _, dataset = magnitude_test_data(np)
+    with pytest.raises(ValueError):
+        spin.iid_spin_magnitude_beta(dataset, amax=-1, alpha_chi=2, beta_chi=2)
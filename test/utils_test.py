@@ -163,3 +163,49 @@ def test_non_callable_op_raises_error():
 
     with pytest.raises(ValueError):
         _condition_func(a=1)
+
+
+def test_cache_scalar_arguments_reuses_result():
+    gwpopulation.set_backend("numpy")
+    calls = list()
+
+    @utils.cache_scalar_arguments(maxsize=8)
+    def func(value):
+        calls.append(value)
+        return value**2
+
+    assert func(3.0) == func(3.0) == 9.0
+    assert len(calls) == 1
+
+
+def test_cache_scalar_arguments_unhashable_input():
+    gwpopulation.set_backend("numpy")
+
+    @utils.cache_scalar_arguments(maxsize=8)
+    def func(value):
+        return value**2
+
+    assert np.array_equal(func(np.arange(3)), np.arange(3) ** 2)
+
+
+@pytest.mark.parametrize("rho", [-0.7, 0.0, 0.5, 0.9])
+def test_bivariate_normal_cdf_matches_scipy(rho):
+    from scipy.stats import multivariate_normal
+
+    gwpopulation.set_backend("numpy")
+    distribution = multivariate_normal(mean=[0, 0], cov=[[1, rho], [rho, 1]])
+    for xx, yy in [(0.3, -1.2), (0, 0), (-2, 0), (1.5, 2.5), (-1, -1)]:
+        assert (
+            abs(utils.bivariate_normal_cdf(xx, yy, rho) - distribution.cdf([xx, yy]))
+            < 1e-6
+        )
+
+
+def test_bivariate_normal_cdf_without_backend_owens_t(monkeypatch):
+    """e.g., cupyx.scipy.special does not provide owens_t"""
+    from types import SimpleNamespace
+
+    gwpopulation.set_backend("numpy")
+    expected = utils.bivariate_normal_cdf(0.3, -1.2, 0.5)
+    monkeypatch.setattr(utils, "scs", SimpleNamespace(ndtr=utils.scs.ndtr))
+    assert utils.bivariate_normal_cdf(0.3, -1.2, 0.5) == expected